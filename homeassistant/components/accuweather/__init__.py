@@ -15,6 +15,8 @@ from .const import (
     CONF_FORECAST,
     COORDINATOR,
     DOMAIN,
+    MANUFACTURER,
+    NAME,
     UNDO_UPDATE_LISTENER,
 )
 
@@ -78,6 +80,12 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
         self.forecast = forecast
         self.is_metric = hass.config.units.is_metric
         self.accuweather = AccuWeather(api_key, session, location_key=self.location_key)
+        self.device_info = {
+            "identifiers": {(DOMAIN, location_key)},
+            "name": NAME,
+            "manufacturer": MANUFACTURER,
+            "entry_type": "service",
+        }
 
         # Enabling the forecast download increases the number of requests per data
         # update, we use 40 minutes for current condition only and 80 minutes for
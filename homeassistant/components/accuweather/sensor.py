@@ -1,4 +1,6 @@
 """Support for the AccuWeather service."""
+from operator import itemgetter
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
@@ -6,6 +8,7 @@ from homeassistant.const import (
     CONF_NAME,
     DEVICE_CLASS_TEMPERATURE,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -17,14 +20,21 @@ from .const import (
     DOMAIN,
     FORECAST_DAYS,
     FORECAST_SENSOR_TYPES,
-    MANUFACTURER,
-    NAME,
     OPTIONAL_SENSORS,
     SENSOR_TYPES,
 )
 
 PARALLEL_UPDATES = 1
 
+ATTRIBUTION_ATTRS = {ATTR_ATTRIBUTION: ATTRIBUTION}
+PRESSURE_TENDENCY_STATES = {
+    "Falling": "falling",
+    "Rising": "rising",
+    "Steady": "steady",
+}
+
+_value = itemgetter("Value")
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Add AccuWeather entities from a config_entry."""
@@ -32,19 +42,18 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
 
-    sensors = []
-    for sensor in SENSOR_TYPES:
-        sensors.append(AccuWeatherSensor(name, sensor, coordinator))
+    sensors = [AccuWeatherSensor(name, sensor, coordinator) for sensor in SENSOR_TYPES]
 
     if coordinator.forecast:
-        for sensor in FORECAST_SENSOR_TYPES:
-            for day in FORECAST_DAYS:
-                # Some air quality/allergy sensors are only available for certain
-                # locations.
-                if sensor in coordinator.data[ATTR_FORECAST][0]:
-                    sensors.append(
-                        AccuWeatherSensor(name, sensor, coordinator, forecast_day=day)
-                    )
+        # Some air quality/allergy sensors are only available for certain
+        # locations.
+        forecast_keys = coordinator.data[ATTR_FORECAST][0].keys()
+        sensors.extend(
+            AccuWeatherSensor(name, sensor, coordinator, forecast_day=day)
+            for sensor in FORECAST_SENSOR_TYPES
+            if sensor in forecast_keys
+            for day in FORECAST_DAYS
+        )
 
     async_add_entities(sensors, False)
 
@@ -55,112 +64,163 @@ class AccuWeatherSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, name, kind, coordinator, forecast_day=None):
         """Initialize."""
         super().__init__(coordinator)
+        if forecast_day is None:
+            self._description = SENSOR_TYPES[kind]
+        else:
+            self._description = FORECAST_SENSOR_TYPES[kind]
         self._name = name
         self.kind = kind
-        self._device_class = None
-        self._attrs = {ATTR_ATTRIBUTION: ATTRIBUTION}
         self._unit_system = "Metric" if self.coordinator.is_metric else "Imperial"
         self.forecast_day = forecast_day
+        if forecast_day is None:
+            self._unique_id = f"{coordinator.location_key}-{kind}".lower()
+        else:
+            self._unique_id = (
+                f"{coordinator.location_key}-{kind}-{forecast_day}".lower()
+            )
+        self._get_sensor_data = _sensor_data_getter(kind, forecast_day)
+        self._sensor_data = self._get_sensor_data(coordinator.data)
+        self._get_state = _state_getter(
+            kind, self._description, forecast_day, self._unit_system
+        )
+        self._get_attrs = _attrs_getter(kind, forecast_day)
+        self._written_state = None
 
     @property
     def name(self):
         """Return the name."""
         if self.forecast_day is not None:
-            return f"{self._name} {FORECAST_SENSOR_TYPES[self.kind][ATTR_LABEL]} {self.forecast_day}d"
-        return f"{self._name} {SENSOR_TYPES[self.kind][ATTR_LABEL]}"
+            return f"{self._name} {self._description[ATTR_LABEL]} {self.forecast_day}d"
+        return f"{self._name} {self._description[ATTR_LABEL]}"
 
     @property
     def unique_id(self):
         """Return a unique_id for this entity."""
-        if self.forecast_day is not None:
-            return f"{self.coordinator.location_key}-{self.kind}-{self.forecast_day}".lower()
-        return f"{self.coordinator.location_key}-{self.kind}".lower()
+        return self._unique_id
 
     @property
     def device_info(self):
         """Return the device info."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.location_key)},
-            "name": NAME,
-            "manufacturer": MANUFACTURER,
-            "entry_type": "service",
-        }
+        return self.coordinator.device_info
 
     @property
     def state(self):
         """Return the state."""
-        if self.forecast_day is not None:
-            if (
-                FORECAST_SENSOR_TYPES[self.kind][ATTR_DEVICE_CLASS]
-                == DEVICE_CLASS_TEMPERATURE
-            ):
-                return self.coordinator.data[ATTR_FORECAST][self.forecast_day][
-                    self.kind
-                ]["Value"]
-            if self.kind in ["WindDay", "WindNight", "WindGustDay", "WindGustNight"]:
-                return self.coordinator.data[ATTR_FORECAST][self.forecast_day][
-                    self.kind
-                ]["Speed"]["Value"]
-            if self.kind in ["Grass", "Mold", "Ragweed", "Tree", "UVIndex", "Ozone"]:
-                return self.coordinator.data[ATTR_FORECAST][self.forecast_day][
-                    self.kind
-                ]["Value"]
-            return self.coordinator.data[ATTR_FORECAST][self.forecast_day][self.kind]
-        if self.kind == "Ceiling":
-            return round(self.coordinator.data[self.kind][self._unit_system]["Value"])
-        if self.kind == "PressureTendency":
-            return self.coordinator.data[self.kind]["LocalizedText"].lower()
-        if SENSOR_TYPES[self.kind][ATTR_DEVICE_CLASS] == DEVICE_CLASS_TEMPERATURE:
-            return self.coordinator.data[self.kind][self._unit_system]["Value"]
-        if self.kind == "Precipitation":
-            return self.coordinator.data["PrecipitationSummary"][self.kind][
-                self._unit_system
-            ]["Value"]
-        if self.kind in ["Wind", "WindGust"]:
-            return self.coordinator.data[self.kind]["Speed"][self._unit_system]["Value"]
-        return self.coordinator.data[self.kind]
+        return self._get_state(self._sensor_data)
 
     @property
     def icon(self):
         """Return the icon."""
-        if self.forecast_day is not None:
-            return FORECAST_SENSOR_TYPES[self.kind][ATTR_ICON]
-        return SENSOR_TYPES[self.kind][ATTR_ICON]
+        return self._description[ATTR_ICON]
 
     @property
     def device_class(self):
         """Return the device_class."""
-        if self.forecast_day is not None:
-            return FORECAST_SENSOR_TYPES[self.kind][ATTR_DEVICE_CLASS]
-        return SENSOR_TYPES[self.kind][ATTR_DEVICE_CLASS]
+        return self._description[ATTR_DEVICE_CLASS]
 
     @property
     def unit_of_measurement(self):
         """Return the unit the value is expressed in."""
-        if self.forecast_day is not None:
-            return FORECAST_SENSOR_TYPES[self.kind][self._unit_system]
-        return SENSOR_TYPES[self.kind][self._unit_system]
+        return self._description[self._unit_system]
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        if self.forecast_day is not None:
-            if self.kind in ["WindDay", "WindNight", "WindGustDay", "WindGustNight"]:
-                self._attrs["direction"] = self.coordinator.data[ATTR_FORECAST][
-                    self.forecast_day
-                ][self.kind]["Direction"]["English"]
-            elif self.kind in ["Grass", "Mold", "Ragweed", "Tree", "UVIndex", "Ozone"]:
-                self._attrs["level"] = self.coordinator.data[ATTR_FORECAST][
-                    self.forecast_day
-                ][self.kind]["Category"]
-            return self._attrs
-        if self.kind == "UVIndex":
-            self._attrs["level"] = self.coordinator.data["UVIndexText"]
-        elif self.kind == "Precipitation":
-            self._attrs["type"] = self.coordinator.data["PrecipitationType"]
-        return self._attrs
+        return self._get_attrs(self._sensor_data, self.coordinator.data)
 
     @property
     def entity_registry_enabled_default(self):
         """Return if the entity should be enabled when first added to the entity registry."""
         return bool(self.kind not in OPTIONAL_SENSORS)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update."""
+        self._sensor_data = self._get_sensor_data(self.coordinator.data)
+        # Most updates do not change the value of every sensor, skip writing the
+        # state when nothing changed since the last write.
+        written_state = (self.available, self.state, self.extra_state_attributes)
+        if written_state == self._written_state:
+            return
+        self._written_state = written_state
+        self.async_write_ha_state()
+
+
+def _sensor_data_getter(kind, forecast_day):
+    """Return a function extracting the sensor data from the coordinator data."""
+    if forecast_day is not None:
+        return lambda data: data[ATTR_FORECAST][forecast_day][kind]
+    if kind == "Precipitation":
+        return lambda data: data["PrecipitationSummary"][kind]
+    return itemgetter(kind)
+
+
+def _state_getter(kind, description, forecast_day, unit_system):
+    """Return a function extracting the state from the sensor data."""
+    if forecast_day is not None:
+        if description[ATTR_DEVICE_CLASS] == DEVICE_CLASS_TEMPERATURE:
+            return _value
+        if kind in ["WindDay", "WindNight", "WindGustDay", "WindGustNight"]:
+            return _speed_value
+        if kind in ["Grass", "Mold", "Ragweed", "Tree", "UVIndex", "Ozone"]:
+            return _value
+        return _raw
+    if kind == "Ceiling":
+        return lambda data: round(data[unit_system]["Value"])
+    if kind == "PressureTendency":
+        return _pressure_tendency
+    if description[ATTR_DEVICE_CLASS] == DEVICE_CLASS_TEMPERATURE:
+        return lambda data: data[unit_system]["Value"]
+    if kind == "Precipitation":
+        return lambda data: data[unit_system]["Value"]
+    if kind in ["Wind", "WindGust"]:
+        return lambda data: data["Speed"][unit_system]["Value"]
+    return _raw
+
+
+def _attrs_getter(kind, forecast_day):
+    """Return a function building the state attributes of the sensor."""
+    if forecast_day is not None:
+        if kind in ["WindDay", "WindNight", "WindGustDay", "WindGustNight"]:
+            return lambda sensor_data, data: {
+                ATTR_ATTRIBUTION: ATTRIBUTION,
+                "direction": sensor_data["Direction"]["English"],
+            }
+        if kind in ["Grass", "Mold", "Ragweed", "Tree", "UVIndex", "Ozone"]:
+            return lambda sensor_data, data: {
+                ATTR_ATTRIBUTION: ATTRIBUTION,
+                "level": sensor_data["Category"],
+            }
+        return _attribution_attrs
+    if kind == "UVIndex":
+        return lambda sensor_data, data: {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            "level": data["UVIndexText"],
+        }
+    if kind == "Precipitation":
+        return lambda sensor_data, data: {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            "type": data["PrecipitationType"],
+        }
+    return _attribution_attrs
+
+
+def _attribution_attrs(sensor_data, data):
+    """Return the attribution only state attributes."""
+    return ATTRIBUTION_ATTRS
+
+
+def _pressure_tendency(data):
+    """Return the pressure tendency state."""
+    text = data["LocalizedText"]
+    return PRESSURE_TENDENCY_STATES.get(text) or text.lower()
+
+
+def _raw(data):
+    """Return the sensor data as is."""
+    return data
+
+
+def _speed_value(data):
+    """Return the speed value of the sensor data."""
+    return data["Speed"]["Value"]
@@ -16,15 +16,7 @@ from homeassistant.const import CONF_NAME, TEMP_CELSIUS, TEMP_FAHRENHEIT
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import utc_from_timestamp
 
-from .const import (
-    ATTR_FORECAST,
-    ATTRIBUTION,
-    CONDITION_CLASSES,
-    COORDINATOR,
-    DOMAIN,
-    MANUFACTURER,
-    NAME,
-)
+from .const import ATTR_FORECAST, ATTRIBUTION, CONDITION_CLASSES, COORDINATOR, DOMAIN
 
 PARALLEL_UPDATES = 1
 
@@ -66,12 +58,7 @@ class AccuWeatherEntity(CoordinatorEntity, WeatherEntity):
     @property
     def device_info(self):
         """Return the device info."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.location_key)},
-            "name": NAME,
-            "manufacturer": MANUFACTURER,
-            "entry_type": "service",
-        }
+        return self.coordinator.device_info
 
     @property
     def condition(self):
@@ -31,13 +31,13 @@ _DEV_EN_REC = "start_recording"
 _DEV_DS_REC = "stop_recording"
 _DEV_SNAP = "snapshot"
 
-CAMERA_SERVICES = {
-    _DEV_EN_ALT: "async_enable_alerts",
-    _DEV_DS_ALT: "async_disable_alerts",
-    _DEV_EN_REC: "async_start_recording",
-    _DEV_DS_REC: "async_stop_recording",
-    _DEV_SNAP: "async_snapshot",
-}
+CAMERA_SERVICES = (
+    (_DEV_EN_ALT, "async_enable_alerts"),
+    (_DEV_DS_ALT, "async_disable_alerts"),
+    (_DEV_EN_REC, "async_start_recording"),
+    (_DEV_DS_REC, "async_stop_recording"),
+    (_DEV_SNAP, "async_snapshot"),
+)
 
 
 async def async_setup_entry(
@@ -52,52 +52,54 @@ async def async_setup_entry(
         _LOGGER.warning("Could not fetch cameras from Agent server")
         return
 
+    # agent-py has no public accessor for the server URL
+    server_url = server._server_url  # pylint: disable=protected-access
     for device in server.devices:
         if device.typeID == 2:
-            camera = AgentCamera(device)
+            camera = AgentCamera(device, server_url)
             cameras.append(camera)
 
     async_add_entities(cameras)
 
     platform = entity_platform.async_get_current_platform()
-    for service, method in CAMERA_SERVICES.items():
+    for service, method in CAMERA_SERVICES:
         platform.async_register_entity_service(service, {}, method)
 
 
 class AgentCamera(MjpegCamera):
     """Representation of an Agent Device Stream."""
 
-    def __init__(self, device):
+    def __init__(self, device, server_url):
         """Initialize as a subclass of MjpegCamera."""
-        self._servername = device.client.name
-        self.server_url = device.client._server_url
-
+        size = f"&size={device.mjpegStreamWidth}x{device.mjpegStreamHeight}"
         device_info = {
             CONF_NAME: device.name,
-            CONF_MJPEG_URL: f"{self.server_url}{device.mjpeg_image_url}&size={device.mjpegStreamWidth}x{device.mjpegStreamHeight}",
-            CONF_STILL_IMAGE_URL: f"{self.server_url}{device.still_image_url}&size={device.mjpegStreamWidth}x{device.mjpegStreamHeight}",
+            CONF_MJPEG_URL: f"{server_url}{device.mjpeg_image_url}{size}",
+            CONF_STILL_IMAGE_URL: f"{server_url}{device.still_image_url}{size}",
         }
         self.device = device
         self._removed = False
-        self._name = f"{self._servername} {device.name}"
         self._unique_id = f"{device._client.unique}_{device.typeID}_{device.id}"
         super().__init__(device_info)
-
-    @property
-    def device_info(self):
-        """Return the device info for adding the entity to the agent object."""
-        return {
+        self._device_info = {
             "identifiers": {(AGENT_DOMAIN, self._unique_id)},
             "name": self._name,
             "manufacturer": "Agent",
             "model": "Camera",
-            "sw_version": self.device.client.version,
+            "sw_version": device.client.version,
         }
+        self._update_state()
+
+    @property
+    def device_info(self):
+        """Return the device info for adding the entity to the agent object."""
+        return self._device_info
 
     async def async_update(self):
         """Update our state from the Agent API."""
         try:
             await self.device.update()
+            self._update_state()
             if self._removed:
                 _LOGGER.debug("%s reacquired", self._name)
             self._removed = False
@@ -107,18 +109,29 @@ class AgentCamera(MjpegCamera):
                 _LOGGER.error("%s lost", self._name)
                 self._removed = True
 
+    def _update_state(self):
+        """Store the state of the device read from the last update."""
+        device = self.device
+        self._is_on = device.online
+        self._is_recording = device.recording
+        self._is_alerted = device.alerted
+        self._is_detected = device.detected
+        self._connected = device.connected
+        self._alerts_enabled = device.alerts_active
+        self._motion_detection_enabled = device.detector_active
+
     @property
     def extra_state_attributes(self):
         """Return the Agent DVR camera state attributes."""
         return {
             ATTR_ATTRIBUTION: ATTRIBUTION,
             "editable": False,
-            "enabled": self.is_on,
-            "connected": self.connected,
-            "detected": self.is_detected,
-            "alerted": self.is_alerted,
+            "enabled": self._is_on,
+            "connected": self._connected,
+            "detected": self._is_detected,
+            "alerted": self._is_alerted,
             "has_ptz": self.device.has_ptz,
-            "alerts_enabled": self.device.alerts_active,
+            "alerts_enabled": self._alerts_enabled,
         }
 
     @property
@@ -129,17 +142,17 @@ class AgentCamera(MjpegCamera):
     @property
     def is_recording(self) -> bool:
         """Return whether the monitor is recording."""
-        return self.device.recording
+        return self._is_recording
 
     @property
     def is_alerted(self) -> bool:
         """Return whether the monitor has alerted."""
-        return self.device.alerted
+        return self._is_alerted
 
     @property
     def is_detected(self) -> bool:
         """Return whether the monitor has alerted."""
-        return self.device.detected
+        return self._is_detected
 
     @property
     def available(self) -> bool:
@@ -149,7 +162,7 @@ class AgentCamera(MjpegCamera):
     @property
     def connected(self) -> bool:
         """Return True if entity is connected."""
-        return self.device.connected
+        return self._connected
 
     @property
     def supported_features(self) -> int:
@@ -159,19 +172,19 @@ class AgentCamera(MjpegCamera):
     @property
     def is_on(self) -> bool:
         """Return true if on."""
-        return self.device.online
+        return self._is_on
 
     @property
     def icon(self):
         """Return the icon to use in the frontend, if any."""
-        if self.is_on:
+        if self._is_on:
             return "mdi:camcorder"
         return "mdi:camcorder-off"
 
     @property
     def motion_detection_enabled(self):
         """Return the camera motion detection status."""
-        return self.device.detector_active
+        return self._motion_detection_enabled
 
     @property
     def unique_id(self) -> str:
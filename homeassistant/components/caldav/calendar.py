@@ -1,5 +1,4 @@
 """Support for WebDav Calendar."""
-import copy
 from datetime import datetime, timedelta
 import logging
 import re
@@ -75,17 +74,19 @@ def setup_platform(hass, config, add_entities, disc_info=None):
     )
 
     calendars = client.principal().calendars()
+    calendar_names = config[CONF_CALENDARS]
+    custom_calendars = config[CONF_CUSTOM_CALENDARS]
 
     calendar_devices = []
-    for calendar in list(calendars):
+    for calendar in calendars:
         # If a calendar name was given in the configuration,
         # ignore all the others
-        if config[CONF_CALENDARS] and calendar.name not in config[CONF_CALENDARS]:
+        if calendar_names and calendar.name not in calendar_names:
             _LOGGER.debug("Ignoring calendar '%s'", calendar.name)
             continue
 
         # Create additional calendars based on custom filtering rules
-        for cust_calendar in config[CONF_CUSTOM_CALENDARS]:
+        for cust_calendar in custom_calendars:
             # Check that the base calendar matches
             if cust_calendar[CONF_CALENDAR] != calendar.name:
                 continue
@@ -100,7 +101,7 @@ def setup_platform(hass, config, add_entities, disc_info=None):
             )
 
         # Create a default calendar if there was no custom one
-        if not config[CONF_CUSTOM_CALENDARS]:
+        if not custom_calendars:
             name = calendar.name
             device_id = calendar.name
             entity_id = generate_entity_id(ENTITY_ID_FORMAT, device_id, hass=hass)
@@ -141,14 +142,15 @@ class WebDavCalendarEventDevice(CalendarEventDevice):
         """Get all events in a specific time frame."""
         return await self.data.async_get_events(hass, start_date, end_date)
 
-    def update(self):
+    async def async_update(self):
         """Update event data."""
-        self.data.update()
-        event = copy.deepcopy(self.data.event)
-        if event is None:
-            self._event = event
+        await self.hass.async_add_executor_job(self.data.update)
+        if self.data.event is None:
+            self._event = None
             return
-        event = calculate_offset(event, OFFSET)
+        # calculate_offset only rewrites top level keys, so a shallow copy keeps
+        # the cached event intact
+        event = calculate_offset(dict(self.data.event), OFFSET)
         self._offset_reached = is_offset_reached(event)
         self._event = event
 
@@ -162,6 +164,7 @@ class WebDavCalendarData:
         self.days = days
         self.include_all_day = include_all_day
         self.search = search
+        self._search_re = re.compile(search) if search is not None else None
         self.event = None
 
     async def async_get_events(self, hass, start_date, end_date):
@@ -173,13 +176,10 @@ class WebDavCalendarData:
         event_list = []
         for event in vevent_list:
             vevent = event.instance.vevent
-            if not self.is_matching(vevent, self.search):
+            if not self.is_matching(vevent):
                 continue
-            uid = None
-            if hasattr(vevent, "uid"):
-                uid = vevent.uid.value
             data = {
-                "uid": uid,
+                "uid": self.get_attr_value(vevent, "uid"),
                 "summary": vevent.summary.value,
                 "start": self.get_hass_date(vevent.dtstart.value),
                 "end": self.get_hass_date(self.get_end_date(vevent)),
@@ -210,37 +210,46 @@ class WebDavCalendarData:
         new_events = []
         for event in results:
             vevent = event.instance.vevent
-            for start_dt in vevent.getrruleset() or []:
+            rruleset = vevent.getrruleset()
+            if not rruleset:
+                continue
+            all_day = self.is_all_day(vevent)
+            if all_day:
+                # Recurrences of all day events are naive datetimes at midnight
+                _start_of_today = start_of_today.replace(tzinfo=None)
+                _start_of_tomorrow = start_of_tomorrow.replace(tzinfo=None)
+            else:
                 _start_of_today = start_of_today
                 _start_of_tomorrow = start_of_tomorrow
-                if self.is_all_day(vevent):
+            for start_dt in rruleset.between(
+                _start_of_today, _start_of_tomorrow, inc=True
+            ):
+                if start_dt == _start_of_tomorrow:
+                    continue
+                if all_day:
                     start_dt = start_dt.date()
-                    _start_of_today = _start_of_today.date()
-                    _start_of_tomorrow = _start_of_tomorrow.date()
-                if _start_of_today <= start_dt < _start_of_tomorrow:
-                    new_event = event.copy()
-                    new_vevent = new_event.instance.vevent
-                    if hasattr(new_vevent, "dtend"):
-                        dur = new_vevent.dtend.value - new_vevent.dtstart.value
-                        new_vevent.dtend.value = start_dt + dur
-                    new_vevent.dtstart.value = start_dt
-                    new_events.append(new_event)
-                elif _start_of_tomorrow <= start_dt:
-                    break
+                new_event = event.copy()
+                new_vevent = new_event.instance.vevent
+                if hasattr(new_vevent, "dtend"):
+                    dur = new_vevent.dtend.value - new_vevent.dtstart.value
+                    new_vevent.dtend.value = start_dt + dur
+                new_vevent.dtstart.value = start_dt
+                new_events.append(new_event)
         vevents = [event.instance.vevent for event in results + new_events]
 
         # dtstart can be a date or datetime depending if the event lasts a
         # whole day. Convert everything to datetime to be able to sort it
         vevents.sort(key=lambda x: self.to_datetime(x.dtstart.value))
 
+        now = dt.now()
         vevent = next(
             (
                 vevent
                 for vevent in vevents
                 if (
-                    self.is_matching(vevent, self.search)
+                    self.is_matching(vevent)
                     and (not self.is_all_day(vevent) or self.include_all_day)
-                    and not self.is_over(vevent)
+                    and not self.is_over(vevent, now)
                 )
             ),
             None,
@@ -265,21 +274,17 @@ class WebDavCalendarData:
             "description": self.get_attr_value(vevent, "description"),
         }
 
-    @staticmethod
-    def is_matching(vevent, search):
+    def is_matching(self, vevent):
         """Return if the event matches the filter criteria."""
-        if search is None:
+        pattern = self._search_re
+        if pattern is None:
             return True
 
-        pattern = re.compile(search)
-        return (
-            hasattr(vevent, "summary")
-            and pattern.match(vevent.summary.value)
-            or hasattr(vevent, "location")
-            and pattern.match(vevent.location.value)
-            or hasattr(vevent, "description")
-            and pattern.match(vevent.description.value)
-        )
+        for attribute in ("summary", "location", "description"):
+            prop = getattr(vevent, attribute, None)
+            if prop is not None and pattern.match(prop.value):
+                return True
+        return False
 
     @staticmethod
     def is_all_day(vevent):
@@ -287,9 +292,9 @@ class WebDavCalendarData:
         return not isinstance(vevent.dtstart.value, datetime)
 
     @staticmethod
-    def is_over(vevent):
+    def is_over(vevent, now):
         """Return if the event is over."""
-        return dt.now() >= WebDavCalendarData.to_datetime(
+        return now >= WebDavCalendarData.to_datetime(
             WebDavCalendarData.get_end_date(vevent)
         )
 
@@ -315,20 +320,20 @@ class WebDavCalendarData:
     @staticmethod
     def get_attr_value(obj, attribute):
         """Return the value of the attribute if defined."""
-        if hasattr(obj, attribute):
-            return getattr(obj, attribute).value
-        return None
+        prop = getattr(obj, attribute, None)
+        if prop is None:
+            return None
+        return prop.value
 
     @staticmethod
     def get_end_date(obj):
         """Return the end datetime as determined by dtend or duration."""
-        if hasattr(obj, "dtend"):
-            enddate = obj.dtend.value
-
-        elif hasattr(obj, "duration"):
-            enddate = obj.dtstart.value + obj.duration.value
+        dtend = getattr(obj, "dtend", None)
+        if dtend is not None:
+            return dtend.value
 
-        else:
-            enddate = obj.dtstart.value + timedelta(days=1)
+        duration = getattr(obj, "duration", None)
+        if duration is not None:
+            return obj.dtstart.value + duration.value
 
-        return enddate
+        return obj.dtstart.value + timedelta(days=1)
@@ -16,7 +16,7 @@ from homeassistant.components.alexa import (
     state_report as alexa_state_report,
 )
 from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, HTTP_BAD_REQUEST
-from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.event import async_call_later
 from homeassistant.setup import async_setup_component
@@ -130,7 +130,7 @@ class AlexaConfig(alexa_config.AbstractConfig):
         if default_expose is None:
             return True
 
-        return split_entity_id(entity_id)[0] in default_expose
+        return entity_id.partition(".")[0] in default_expose
 
     @callback
     def async_invalidate_access_token(self):
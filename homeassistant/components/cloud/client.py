@@ -44,6 +44,10 @@ class CloudClient(Interface):
         self.alexa_user_config = alexa_user_config
         self._alexa_config = None
         self._google_config = None
+        self._alexa_config_init_lock = asyncio.Lock()
+        self._google_config_init_lock = asyncio.Lock()
+        self._remote_update_data: Any = None
+        self._remote_update_scheduled = False
 
     @property
     def base_path(self) -> Path:
@@ -82,29 +86,45 @@ class CloudClient(Interface):
 
     async def get_alexa_config(self) -> alexa_config.AlexaConfig:
         """Return Alexa config."""
-        if self._alexa_config is None:
+        if self._alexa_config is not None:
+            return self._alexa_config
+
+        async with self._alexa_config_init_lock:
+            # Another caller may have set up the config while we waited
+            if self._alexa_config is not None:
+                return self._alexa_config
+
             assert self.cloud is not None
 
             cloud_user = await self._prefs.get_cloud_user()
 
-            self._alexa_config = alexa_config.AlexaConfig(
+            alexa_conf = alexa_config.AlexaConfig(
                 self._hass, self.alexa_user_config, cloud_user, self._prefs, self.cloud
             )
-            await self._alexa_config.async_initialize()
+            await alexa_conf.async_initialize()
+            self._alexa_config = alexa_conf
 
         return self._alexa_config
 
     async def get_google_config(self) -> google_config.CloudGoogleConfig:
         """Return Google config."""
-        if not self._google_config:
+        if self._google_config is not None:
+            return self._google_config
+
+        async with self._google_config_init_lock:
+            # Another caller may have set up the config while we waited
+            if self._google_config is not None:
+                return self._google_config
+
             assert self.cloud is not None
 
             cloud_user = await self._prefs.get_cloud_user()
 
-            self._google_config = google_config.CloudGoogleConfig(
+            google_conf = google_config.CloudGoogleConfig(
                 self._hass, self.google_user_config, cloud_user, self._prefs, self.cloud
             )
-            await self._google_config.async_initialize()
+            await google_conf.async_initialize()
+            self._google_config = google_conf
 
         return self._google_config
 
@@ -166,8 +186,23 @@ class CloudClient(Interface):
     @callback
     def dispatcher_message(self, identifier: str, data: Any = None) -> None:
         """Match cloud notification to dispatcher."""
-        if identifier.startswith("remote_"):
-            async_dispatcher_send(self._hass, DISPATCHER_REMOTE_UPDATE, data)
+        if not identifier.startswith("remote_"):
+            return
+
+        # Remote updates arrive in bursts, notify listeners once per event
+        # loop iteration with the latest data.
+        self._remote_update_data = data
+        if not self._remote_update_scheduled:
+            self._remote_update_scheduled = True
+            self._hass.loop.call_soon(self._async_send_remote_update)
+
+    @callback
+    def _async_send_remote_update(self) -> None:
+        """Send the latest remote update to the dispatcher."""
+        self._remote_update_scheduled = False
+        async_dispatcher_send(
+            self._hass, DISPATCHER_REMOTE_UPDATE, self._remote_update_data
+        )
 
     async def async_alexa_message(self, payload: dict[Any, Any]) -> dict[Any, Any]:
         """Process cloud alexa message to client."""
@@ -194,13 +229,7 @@ class CloudClient(Interface):
 
     async def async_webhook_message(self, payload: dict[Any, Any]) -> dict[Any, Any]:
         """Process cloud webhook message to client."""
-        cloudhook_id = payload["cloudhook_id"]
-
-        found = None
-        for cloudhook in self._prefs.cloudhooks.values():
-            if cloudhook["cloudhook_id"] == cloudhook_id:
-                found = cloudhook
-                break
+        found = self._prefs.cloudhooks_by_id.get(payload["cloudhook_id"])
 
         if found is None:
             return {"status": HTTP_OK}
@@ -217,12 +246,9 @@ class CloudClient(Interface):
             found["webhook_id"], request
         )
 
-        response_dict = utils.aiohttp_serialize_response(response)
-        body = response_dict.get("body")
-
         return {
-            "body": body,
-            "status": response_dict["status"],
+            "body": utils.aiohttp_serialize_response_body(response),
+            "status": response.status,
             "headers": {"Content-Type": response.content_type},
         }
 
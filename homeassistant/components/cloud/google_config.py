@@ -8,7 +8,7 @@ from hass_nabucasa.google_report_state import ErrorResponse
 from homeassistant.components.google_assistant.const import DOMAIN as GOOGLE_DOMAIN
 from homeassistant.components.google_assistant.helpers import AbstractConfig
 from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, HTTP_OK
-from homeassistant.core import CoreState, split_entity_id
+from homeassistant.core import CoreState
 from homeassistant.helpers import entity_registry
 from homeassistant.setup import async_setup_component
 
@@ -129,7 +129,7 @@ class CloudGoogleConfig(AbstractConfig):
         if default_expose is None:
             return True
 
-        return split_entity_id(entity_id)[0] in default_expose
+        return entity_id.partition(".")[0] in default_expose
 
     @property
     def agent_user_id(self):
@@ -50,6 +50,7 @@ class CloudPreferences:
         self._hass = hass
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self._prefs = None
+        self._cloudhooks_by_id = None
         self._listeners = []
 
     async def async_initialize(self):
@@ -60,6 +61,7 @@ class CloudPreferences:
             prefs = self._empty_config("")
 
         self._prefs = prefs
+        self._cloudhooks_by_id = None
 
         if PREF_GOOGLE_LOCAL_WEBHOOK_ID not in self._prefs:
             await self._save_prefs(
@@ -287,6 +289,16 @@ class CloudPreferences:
         """Return the published cloud webhooks."""
         return self._prefs.get(PREF_CLOUDHOOKS, {})
 
+    @property
+    def cloudhooks_by_id(self):
+        """Return the published cloud webhooks keyed by cloudhook ID."""
+        if self._cloudhooks_by_id is None:
+            self._cloudhooks_by_id = {
+                cloudhook["cloudhook_id"]: cloudhook
+                for cloudhook in self.cloudhooks.values()
+            }
+        return self._cloudhooks_by_id
+
     @property
     def tts_default_voice(self):
         """Return the default TTS voice."""
@@ -351,6 +363,7 @@ class CloudPreferences:
     async def _save_prefs(self, prefs):
         """Save preferences to disk."""
         self._prefs = prefs
+        self._cloudhooks_by_id = None
         await self._store.async_save(self._prefs)
 
         for listener in self._listeners:
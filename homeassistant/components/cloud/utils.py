@@ -8,6 +8,15 @@ from aiohttp import payload, web
 
 def aiohttp_serialize_response(response: web.Response) -> dict[str, Any]:
     """Serialize an aiohttp response to a dictionary."""
+    return {
+        "status": response.status,
+        "body": aiohttp_serialize_response_body(response),
+        "headers": dict(response.headers),
+    }
+
+
+def aiohttp_serialize_response_body(response: web.Response) -> str | None:
+    """Serialize the body of an aiohttp response to a string."""
     body = response.body
 
     if body is None:
@@ -20,4 +29,4 @@ def aiohttp_serialize_response(response: web.Response) -> dict[str, Any]:
     else:
         raise ValueError("Unknown payload encoding")
 
-    return {"status": response.status, "body": body, "headers": dict(response.headers)}
+    return body
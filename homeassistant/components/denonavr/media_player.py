@@ -171,19 +171,16 @@ class DenonDevice(MediaPlayerEntity):
             available = True
             try:
                 return await func(self, *args, **kwargs)
-            except AvrTimoutError:
+            except (AvrTimoutError, AvrNetworkError) as err:
                 available = False
                 if self._available is True:
+                    if isinstance(err, AvrTimoutError):
+                        error = "Timeout"
+                    else:
+                        error = "Network error"
                     _LOGGER.warning(
-                        "Timeout connecting to Denon AVR receiver at host %s. Device is unavailable",
-                        self._receiver.host,
-                    )
-                    self._available = False
-            except AvrNetworkError:
-                available = False
-                if self._available is True:
-                    _LOGGER.warning(
-                        "Network error connecting to Denon AVR receiver at host %s. Device is unavailable",
+                        "%s connecting to Denon AVR receiver at host %s. Device is unavailable",
+                        error,
                         self._receiver.host,
                     )
                     self._available = False
@@ -12,6 +12,15 @@ _LOGGER = logging.getLogger(__name__)
 class ConnectDenonAVR:
     """Class to async connect to a DenonAVR receiver."""
 
+    __slots__ = [
+        "_async_client_getter",
+        "_receiver",
+        "_host",
+        "_show_all_inputs",
+        "_timeout",
+        "_zones",
+    ]
+
     def __init__(
         self,
         host: str,
@@ -43,8 +43,12 @@ class DoorBirdSwitch(DoorBirdEntity, SwitchEntity):
 
         if relay == IR_RELAY:
             self._time = datetime.timedelta(minutes=5)
+            self._name = f"{doorstation.name} IR"
+            self._icon = "mdi:lightbulb"
         else:
             self._time = datetime.timedelta(seconds=5)
+            self._name = f"{doorstation.name} Relay {relay}"
+            self._icon = "mdi:dip-switch"
         self._unique_id = f"{self._mac_addr}_{self._relay}"
         self._reset_sub = None
 
@@ -56,15 +60,12 @@ class DoorBirdSwitch(DoorBirdEntity, SwitchEntity):
     @property
     def name(self):
         """Return the name of the switch."""
-        if self._relay == IR_RELAY:
-            return f"{self._doorstation.name} IR"
-
-        return f"{self._doorstation.name} Relay {self._relay}"
+        return self._name
 
     @property
     def icon(self):
         """Return the icon to display."""
-        return "mdi:lightbulb" if self._relay == IR_RELAY else "mdi:dip-switch"
+        return self._icon
 
     @property
     def should_poll(self):
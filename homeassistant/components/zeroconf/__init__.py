@@ -4,8 +4,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from contextlib import suppress
 import fnmatch
-import ipaddress
-from ipaddress import ip_address
+from ipaddress import IPv4Address, IPv6Address, ip_address
 import logging
 import socket
 from typing import Any, TypedDict, cast
@@ -43,11 +42,13 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "zeroconf"
 
 ZEROCONF_TYPE = "_home-assistant._tcp.local."
-HOMEKIT_TYPES = [
-    "_hap._tcp.local.",
-    # Thread based devices
-    "_hap._udp.local.",
-]
+HOMEKIT_TYPES = frozenset(
+    {
+        "_hap._tcp.local.",
+        # Thread based devices
+        "_hap._udp.local.",
+    }
+)
 
 CONF_DEFAULT_INTERFACE = "default_interface"
 CONF_IPV6 = "ipv6"
@@ -329,6 +330,12 @@ async def _async_start_zeroconf_browser(
                     # likely bad homekit data
                     return
 
+        # Not all homekit types are currently used for discovery
+        # so not all service type exist in zeroconf_types
+        matchers = zeroconf_types.get(service_type)
+        if not matchers:
+            return
+
         if "name" in info:
             lowercase_name: str | None = info["name"].lower()
         else:
@@ -346,9 +353,7 @@ async def _async_start_zeroconf_browser(
         else:
             lowercase_manufacturer = None
 
-        # Not all homekit types are currently used for discovery
-        # so not all service type exist in zeroconf_types
-        for matcher in zeroconf_types.get(service_type, []):
+        for matcher in matchers:
             if len(matcher) > 1:
                 if "macaddress" in matcher and (
                     uppercase_mac is None
@@ -385,13 +390,14 @@ def handle_homekit(
 
     Return if discovery was forwarded.
     """
-    model = None
     props = info["properties"]
+    model = props.get(HOMEKIT_MODEL)
 
-    for key in props:
-        if key.lower() == HOMEKIT_MODEL:
-            model = props[key]
-            break
+    if model is None:
+        for key in props:
+            if key.lower() == HOMEKIT_MODEL:
+                model = props[key]
+                break
 
     if model is None:
         return False
@@ -418,7 +424,8 @@ def handle_homekit(
 
 def info_from_service(service: ServiceInfo) -> HaServiceInfo | None:
     """Return prepared info from mDNS entries."""
-    properties: dict[str, Any] = {"_raw": {}}
+    raw: dict[str, Any] = {}
+    properties: dict[str, Any] = {"_raw": raw}
 
     for key, value in service.properties.items():
         # See https://ietf.org/rfc/rfc6763.html#section-6.4 and
@@ -432,19 +439,28 @@ def info_from_service(service: ServiceInfo) -> HaServiceInfo | None:
             )
             continue
 
-        properties["_raw"][key] = value
+        raw[key] = value
 
-        with suppress(UnicodeDecodeError):
-            if isinstance(value, bytes):
-                properties[key] = value.decode("utf-8")
+        if not isinstance(value, bytes):
+            continue
+        try:
+            properties[key] = value.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
 
     if not service.addresses:
         return None
 
     address = service.addresses[0]
+    # Addresses are packed, the length tells the version apart without
+    # going through ip_address trying IPv4 first
+    if len(address) == 4:
+        host = str(IPv4Address(address))
+    else:
+        host = str(IPv6Address(address))
 
     return {
-        "host": str(ipaddress.ip_address(address)),
+        "host": host,
         "port": service.port,
         "hostname": service.server,
         "type": service.type,
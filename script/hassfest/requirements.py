@@ -146,7 +146,6 @@ def ensure_cache():
             ["pipdeptree", "-w", "silence", "--json"],
             check=True,
             capture_output=True,
-            text=True,
         ).stdout
     ):
         cache[item["package"]["key"]] = {
@@ -626,6 +626,38 @@ async def test_availability(hass):
         assert state.state == "3200"
 
 
+async def test_skip_unchanged_state_write(hass):
+    """Ensure that the state is not written again when the data did not change."""
+    await init_integration(hass)
+
+    current = json.loads(load_fixture("accuweather/current_conditions_data.json"))
+    current["Ceiling"]["Metric"]["Value"] = 3300
+
+    future = utcnow() + timedelta(minutes=60)
+    with patch(
+        "homeassistant.components.accuweather.AccuWeather.async_get_current_conditions",
+        return_value=current,
+    ):
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.home_cloud_ceiling")
+    assert state
+    assert state.state == "3300"
+
+    future = utcnow() + timedelta(minutes=120)
+    with patch(
+        "homeassistant.components.accuweather.AccuWeather.async_get_current_conditions",
+        return_value=current,
+    ), patch(
+        "homeassistant.components.accuweather.sensor.AccuWeatherSensor.async_write_ha_state"
+    ) as mock_write_ha_state:
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert mock_write_ha_state.call_count == 0
+
+
 async def test_manual_update_entity(hass):
     """Test manual update entity via service homeasasistant/update_entity."""
     await init_integration(hass, forecast=True)
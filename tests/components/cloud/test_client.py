@@ -1,4 +1,5 @@
 """Test the cloud.iot module."""
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -8,7 +9,11 @@ import pytest
 
 from homeassistant.components.cloud import DOMAIN
 from homeassistant.components.cloud.client import CloudClient
-from homeassistant.components.cloud.const import PREF_ENABLE_ALEXA, PREF_ENABLE_GOOGLE
+from homeassistant.components.cloud.const import (
+    DISPATCHER_REMOTE_UPDATE,
+    PREF_ENABLE_ALEXA,
+    PREF_ENABLE_GOOGLE,
+)
 from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import State
 from homeassistant.setup import async_setup_component
@@ -252,6 +257,39 @@ async def test_google_config_should_2fa(hass, mock_cloud_setup, mock_cloud_login
     assert not gconf.should_2fa(state)
 
 
+async def test_google_config_initialized_once(hass, mock_cloud_setup, mock_cloud_login):
+    """Test concurrent callers share a single Google config."""
+    cloud_client = hass.data[DOMAIN].client
+
+    gconf, gconf2 = await asyncio.gather(
+        cloud_client.get_google_config(), cloud_client.get_google_config()
+    )
+
+    assert gconf is gconf2
+    assert await cloud_client.get_google_config() is gconf
+
+
+async def test_remote_updates_coalesced(hass):
+    """Test remote updates in the same loop iteration dispatch once."""
+    client = CloudClient(hass, None, None, {}, {})
+    calls = []
+    hass.helpers.dispatcher.async_dispatcher_connect(
+        DISPATCHER_REMOTE_UPDATE, calls.append
+    )
+
+    client.dispatcher_message("remote_connect", "first")
+    client.dispatcher_message("remote_disconnect", "second")
+    client.dispatcher_message("not_remote", "ignored")
+    await hass.async_block_till_done()
+
+    assert calls == ["second"]
+
+    client.dispatcher_message("remote_connect", "third")
+    await hass.async_block_till_done()
+
+    assert calls == ["second", "third"]
+
+
 async def test_set_username(hass):
     """Test we set username during login."""
     prefs = MagicMock(
@@ -90,3 +90,20 @@ async def test_setup_remove_cloud_user(hass, hass_storage):
     assert cloud_user2
     assert cloud_user2.groups[0].id == GROUP_ID_ADMIN
     assert cloud_user2.id != cloud_user.id
+
+
+async def test_cloudhooks_by_id(hass):
+    """Test cloudhooks are indexed by cloudhook ID and refreshed on update."""
+    prefs = CloudPreferences(hass)
+    await prefs.async_initialize()
+
+    assert prefs.cloudhooks_by_id == {}
+
+    cloudhook = {"webhook_id": "mock-webhook-id", "cloudhook_id": "mock-cloud-id"}
+    await prefs.async_update(cloudhooks={"mock-webhook-id": cloudhook})
+
+    assert prefs.cloudhooks_by_id == {"mock-cloud-id": cloudhook}
+
+    await prefs.async_update(cloudhooks={})
+
+    assert prefs.cloudhooks_by_id == {}
@@ -52,3 +52,12 @@ def test_serialize_json():
         "body": '{"how": "what"}',
         "headers": {"Content-Type": "application/json; charset=utf-8"},
     }
+
+
+def test_serialize_response_body():
+    """Test serializing only the body of a response."""
+    assert (
+        utils.aiohttp_serialize_response_body(web.Response(status=201, text="Hello"))
+        == "Hello"
+    )
+    assert utils.aiohttp_serialize_response_body(web.Response(status=201)) is None
@@ -601,6 +601,24 @@ async def test_homekit_not_paired(hass, mock_zeroconf):
     assert mock_config_flow.mock_calls[0][1][0] == "homekit_controller"
 
 
+async def test_homekit_model_key_case_insensitive(hass):
+    """Test the HomeKit model is found regardless of the property key case."""
+    info = {
+        "host": "10.0.0.20",
+        "port": 80,
+        "hostname": "name.local.",
+        "type": "_hap._tcp.local.",
+        "name": "test._hap._tcp.local.",
+        "properties": {"MD": "LIFX bulb"},
+    }
+    with patch.object(hass.config_entries.flow, "async_init") as mock_config_flow:
+        assert zeroconf.handle_homekit(hass, {"LIFX": "lifx"}, info)
+        await hass.async_block_till_done()
+
+    assert len(mock_config_flow.mock_calls) == 1
+    assert mock_config_flow.mock_calls[0][1][0] == "lifx"
+
+
 async def test_info_from_service_non_utf8(hass):
     """Test info_from_service handles non UTF-8 property keys and values correctly."""
     service_type = "_test._tcp.local."